@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from pathlib import Path
-from typing import Generator
+from typing import Generator, Iterator
 
 import peewee
 import requests
@@ -154,9 +154,9 @@ class Publication(BaseModel):
             hero_emoji=settings.HERO_EMOJI_UPDATE if update else settings.HERO_EMOJI_NEW,
         )
 
-    def render_as_html(self) -> str:
+    def stream_as_html(self) -> Iterator[str]:
         results = self.fetch_results()
-        return templates.render_template(
+        return templates.stream_template(
             'results.html',
             process=self.board.speciality.corp.process,
             corp=self.board.speciality.corp,
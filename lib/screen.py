@@ -1,4 +1,7 @@
-from flask import Flask
+import zlib
+from typing import Iterator
+
+from flask import Flask, Response, request, stream_with_context
 
 import settings
 
@@ -7,7 +10,22 @@ from .db import Publication
 app = Flask(__name__, static_folder=settings.STATIC_DIR, template_folder=settings.TEMPLATES_DIR)
 
 
+def gzip_stream(chunks: Iterator[str]) -> Iterator[bytes]:
+    """Compress chunks on the fly, flushing each one so the client receives it right away."""
+    compressor = zlib.compressobj(settings.GZIP_LEVEL, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+    for chunk in chunks:
+        yield compressor.compress(chunk.encode()) + compressor.flush(zlib.Z_SYNC_FLUSH)
+    yield compressor.flush()
+
+
 @app.route('/screen/<int:publication_pk>/')
-def display(publication_pk: int) -> str:
+def display(publication_pk: int) -> Response:
     publication = Publication.get(Publication.id == publication_pk)
-    return publication.render_as_html()
+    chunks = stream_with_context(publication.stream_as_html())
+    if request.accept_encodings['gzip']:
+        response = Response(gzip_stream(chunks), mimetype='text/html')
+        response.headers['Content-Encoding'] = 'gzip'
+    else:
+        response = Response(chunks, mimetype='text/html')
+    response.headers['Vary'] = 'Accept-Encoding'
+    return response
@@ -20,3 +20,11 @@ def render_template(template_path, **context):
     """Render a template with the given context."""
     template = env.get_template(template_path)
     return template.render(**context)
+
+
+def stream_template(template_path, buffer_size=settings.STREAM_BUFFER_SIZE, **context):
+    """Render a template with the given context as a stream of chunks."""
+    template = env.get_template(template_path)
+    stream = template.stream(**context)
+    stream.enable_buffering(buffer_size)
+    return stream
@@ -39,6 +39,9 @@ TEMPLATES_DIR = config('TEMPLATES_DIR', default=PROJECT_DIR / 'templates', cast=
 STATIC_DIR = config('STATIC_DIR', default=PROJECT_DIR / 'static', cast=Path)
 DATA_PATH = config('DATA_PATH', default=PROJECT_DIR / 'data', cast=Path)
 
+STREAM_BUFFER_SIZE = config('STREAM_BUFFER_SIZE', default=50, cast=int)
+GZIP_LEVEL = config('GZIP_LEVEL', default=6, cast=int)
+
 HERO_EMOJI_NEW = config('HERO_EMOJI_NEW', default='💫')
 HERO_EMOJI_UPDATE = config('HERO_EMOJI_UPDATE', default='🔄')
 NONE_REPR = config('NONE_REPR', default='-')